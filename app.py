@@ -1,10 +1,10 @@
 import os
-import re
 from urllib.parse import urlparse
 
 import requests
 import trafilatura
 from flask import Flask, request, abort
+from markupsafe import escape
 
 app = Flask(__name__)
 
@@ -41,8 +41,8 @@ def is_allowed(url: str) -> bool:
 
 
 def clean_title(t: str) -> str:
-    t = (t or "").strip()
-    t = re.sub(r"\s+", " ", t)
+    # split/join trims and collapses whitespace runs in one pass, no regex
+    t = " ".join((t or "").split())
     return t[:200]
 
 
@@ -207,14 +207,8 @@ def source_name(url: str) -> str:
 
 
 def escape_html(s: str) -> str:
-    return (
-        (s or "")
-        .replace("&", "&amp;")
-        .replace("<", "&lt;")
-        .replace(">", "&gt;")
-        .replace('"', "&quot;")
-        .replace("'", "&#39;")
-    )
+    # MarkupSafe ships with Flask and escapes in C
+    return str(escape(s or ""))
 
 
 def escape_attr(s: str) -> str:
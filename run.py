@@ -1,11 +1,17 @@
 #!/usr/bin/env python3
 import os
 import sys
+import io
+import re
 import json
 import html
+import time
 import datetime as dt
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import quote_plus
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import xml.etree.ElementTree as ET
 
 # -----------------------------
@@ -16,25 +22,71 @@ CARDIFF_LAT = 51.4816
 CARDIFF_LON = -3.1791
 TIMEZONE = "Europe/London"
 
+# Shared so feeds on the same host reuse one keep-alive connection.
+# requests already negotiates gzip/deflate and decodes transparently.
+# Transient 5xx responses on idempotent requests are retried with our own
+# short backoff; Retry-After is ignored, since a server asking for an hour
+# would otherwise stall the whole cron run. Read timeouts are not retried
+# (a hung host would cost the full timeout each time) and failed connects
+# get one more try.
+SESSION = requests.Session()
+_retry_adapter = HTTPAdapter(
+    max_retries=Retry(
+        total=3,
+        connect=1,
+        read=0,
+        backoff_factor=0.5,
+        status_forcelist=[500, 502, 503, 504],
+        respect_retry_after_header=False,
+    )
+)
+SESSION.mount("https://", _retry_adapter)
+SESSION.mount("http://", _retry_adapter)
+
+# Markup some feeds put inside <description> (e.g. <p>, <a>, <img>)
+TAG_RE = re.compile(r"<[^>]+>")
+
+# Next.js embeds its page data as JSON in a script tag with id="__NEXT_DATA__"
+NEXT_DATA_RE = re.compile(r'<script[^>]+id="__NEXT_DATA__"[^>]*>(.*?)</script>', re.S)
+
+
+# Resolved once; None if tzdata is unavailable on the host
+try:
+    from zoneinfo import ZoneInfo
+    LOCAL_TZ = ZoneInfo(TIMEZONE)
+except Exception:
+    LOCAL_TZ = None
+
 
 def now_local() -> dt.datetime:
     # Render runs in UTC; we want UK-local date display
-    try:
-        from zoneinfo import ZoneInfo
-        return dt.datetime.now(ZoneInfo(TIMEZONE))
-    except Exception:
-        return dt.datetime.utcnow()
+    if LOCAL_TZ is not None:
+        return dt.datetime.now(LOCAL_TZ)
+    return dt.datetime.utcnow()
+
+
+# Same output as html.escape(quote=True), in a single C-level pass
+HTML_ESCAPE_TABLE = str.maketrans({
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#x27;",
+})
 
 
 def e(x) -> str:
-    return html.escape("" if x is None else str(x))
+    return ("" if x is None else str(x)).translate(HTML_ESCAPE_TABLE)
+
+
+TRUE_VALUES = frozenset({"1", "true", "yes", "y", "on"})
 
 
 def bool_env(name: str, default: bool = False) -> bool:
     v = os.getenv(name, "")
     if v == "":
         return default
-    return v.strip().lower() in ("1", "true", "yes", "y", "on")
+    return v.strip().lower() in TRUE_VALUES
 
 
 def env_required(name: str) -> str:
@@ -44,6 +96,11 @@ def env_required(name: str) -> str:
     return v
 
 
+# Resolved once at import; the env can't change during a cron run
+READER_BASE_URL = (os.getenv("READER_BASE_URL", "") or "").rstrip("/")
+READER_PREFIX = f"{READER_BASE_URL}/read?url=" if READER_BASE_URL else ""
+
+
 def reader_link(original_url: str) -> str:
     """
     Turns a story URL into your Reader URL if READER_BASE_URL is set.
@@ -51,10 +108,37 @@ def reader_link(original_url: str) -> str:
     """
     if not original_url:
         return ""
-    base = (os.getenv("READER_BASE_URL", "") or "").rstrip("/")
-    if not base:
+    if not READER_PREFIX:
         return original_url
-    return f"{base}/read?url={quote_plus(original_url)}"
+    return READER_PREFIX + quote_plus(original_url)
+
+
+# Small JSON cache: one <key>.json per entry. Sidebar data is reused within
+# its TTL; feed validators and items are kept for conditional GETs.
+CACHE_DIR = os.getenv("CACHE_DIR", ".cache")
+
+
+def cache_get(key: str, ttl_seconds: float):
+    """
+    Returns the cached value for key if younger than ttl_seconds, else None.
+    """
+    try:
+        with open(os.path.join(CACHE_DIR, f"{key}.json"), "r", encoding="utf-8") as f:
+            envelope = json.load(f)
+        if time.time() - float(envelope["saved_at"]) <= ttl_seconds:
+            return envelope["value"]
+    except Exception:
+        pass
+    return None
+
+
+def cache_put(key: str, value) -> None:
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(os.path.join(CACHE_DIR, f"{key}.json"), "w", encoding="utf-8") as f:
+            json.dump({"saved_at": time.time(), "value": value}, f)
+    except Exception as ex:
+        print(f"Cache {key} not saved:", repr(ex))
 
 
 # -----------------------------
@@ -68,52 +152,99 @@ DEFAULT_WORLD_FEEDS = [
     "https://feeds.bbci.co.uk/news/rss.xml",
 ]
 
+# Only the newest few items of each feed can make the edition (which takes
+# 3); the headroom covers URLs shared between feeds.
+FEED_ITEM_CAP = 10
 
-def parse_rss_items(xml_text: str):
+
+def strip_html(text: str) -> str:
     """
-    Returns list of dicts: {title, url, source, summary}
+    Feed summaries may carry markup and entities; keep readable text only.
+    One tag pass, then html.unescape for the full HTML5 entity table.
     """
-    items = []
-    root = ET.fromstring(xml_text)
+    if "<" in text:
+        text = TAG_RE.sub(" ", text)
+    if "&" in text:
+        text = html.unescape(text)
+    return " ".join(text.split())
+
 
-    # RSS 2.0: channel/item
-    channel = root.find("channel")
-    if channel is not None:
-        for it in channel.findall("item"):
-            title = (it.findtext("title") or "").strip()
-            link = (it.findtext("link") or "").strip()
-            desc = (it.findtext("description") or "").strip()
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+
+
+def parse_rss_items(xml_data: bytes, limit=None):
+    """
+    Stream-parses the raw feed body (bytes, so expat honours the XML
+    encoding declaration). Returns list of dicts: {title, url, summary}.
+    With `limit`, stops reading the document once that many items are
+    collected (feeds are newest-first), and clears each item as it goes.
+    """
+    items = []
+    for _, el in ET.iterparse(io.BytesIO(xml_data), events=("end",)):
+        # RSS 2.0: channel/item
+        if el.tag == "item":
+            title = (el.findtext("title") or "").strip()
+            link = (el.findtext("link") or "").strip()
+            desc = (el.findtext("description") or "").strip()
 
             # try to strip some HTML-ish noise from RSS description
-            summary = desc
-            summary = summary.replace("<![CDATA[", "").replace("]]>", "")
-            summary = summary.replace("\n", " ").strip()
-
-            if title and link:
-                items.append(
-                    {
-                        "title": title,
-                        "url": link,
-                        "summary": summary,
-                    }
-                )
-        return items
-
-    # Atom: entry
-    ns = {"atom": "http://www.w3.org/2005/Atom"}
-    for entry in root.findall("atom:entry", ns):
-        title = (entry.findtext("atom:title", default="", namespaces=ns) or "").strip()
-        link_el = entry.find("atom:link", ns)
-        link = (link_el.get("href", "").strip() if link_el is not None else "")
-        summary = (entry.findtext("atom:summary", default="", namespaces=ns) or "").strip()
+            summary = desc.replace("<![CDATA[", "").replace("]]>", "")
+
+        # Atom: entry
+        elif el.tag == ATOM_NS + "entry":
+            title = (el.findtext(ATOM_NS + "title") or "").strip()
+            link_el = el.find(ATOM_NS + "link")
+            link = (link_el.get("href", "").strip() if link_el is not None else "")
+            summary = el.findtext(ATOM_NS + "summary") or ""
+
+        else:
+            continue
+
+        el.clear()
+        # Only pay for tag stripping on entries we actually keep
         if title and link:
-            items.append({"title": title, "url": link, "summary": summary})
+            items.append({"title": title, "url": link, "summary": strip_html(summary)})
+            if limit is not None and len(items) >= limit:
+                break
     return items
 
 
+def fetch_feed_items(feed_url: str, headers: dict, cached=None):
+    """
+    Fetches and parses one feed with a conditional GET.
+    Returns (items, cache_entry). On 304 the cached items are reused;
+    on any failure returns [] so a single bad feed never kills the run.
+    """
+    cached = cached or {}
+    req_headers = dict(headers)
+    if "items" in cached:
+        if cached.get("etag"):
+            req_headers["If-None-Match"] = cached["etag"]
+        if cached.get("modified"):
+            req_headers["If-Modified-Since"] = cached["modified"]
+
+    try:
+        r = SESSION.get(feed_url, timeout=15, headers=req_headers)
+        if r.status_code == 304 and "items" in cached:
+            return cached["items"], cached
+        r.raise_for_status()
+        items = parse_rss_items(r.content, limit=FEED_ITEM_CAP)
+        entry = {
+            "etag": r.headers.get("ETag", ""),
+            "modified": r.headers.get("Last-Modified", ""),
+            "items": items,
+        }
+        return items, entry
+    except Exception:
+        return [], cached
+
+
 def fetch_world_stories(limit=3):
     """
     Pulls stories from WORLD_FEEDS (comma-separated) or defaults.
+    Feeds are fetched concurrently, then merged in the configured order.
+    ETag/Last-Modified are kept in the "feeds" cache entry so unchanged
+    feeds come back as 304 and skip download + parse.
     """
     feeds_raw = os.getenv("WORLD_FEEDS", "").strip()
     feeds = [f.strip() for f in feeds_raw.split(",") if f.strip()] if feeds_raw else DEFAULT_WORLD_FEEDS
@@ -125,33 +256,42 @@ def fetch_world_stories(limit=3):
         "User-Agent": "2k-times-bot/1.0 (+https://example.com) python-requests"
     }
 
-    for feed_url in feeds:
-        try:
-            r = requests.get(feed_url, timeout=15, headers=headers)
-            r.raise_for_status()
-            items = parse_rss_items(r.text)
-
-            # Infer source name
-            source = "BBC" if "bbc.co.uk" in feed_url else "News"
-
-            for it in items:
-                key = it["url"]
-                if key in seen:
-                    continue
-                seen.add(key)
-                collected.append(
-                    {
-                        "source": source,
-                        "title": it["title"],
-                        "summary": it.get("summary", "") or "",
-                        "url": it["url"],
-                        "reader_url": reader_link(it["url"]),
-                    }
-                )
-                if len(collected) >= limit:
-                    return collected
-        except Exception:
-            continue
+    # {feed_url: {etag, modified, items}}; validators don't expire, the
+    # server decides freshness
+    cache = cache_get("feeds", float("inf"))
+    if not isinstance(cache, dict):
+        cache = {}
+    with ThreadPoolExecutor(max_workers=min(8, len(feeds) or 1)) as ex:
+        results = list(ex.map(lambda u: fetch_feed_items(u, headers, cache.get(u)), feeds))
+
+    # Rebuilt from the current feeds so dropped ones don't linger on disk.
+    # Only worth keeping if the server gave us a validator to send back.
+    cache_put("feeds", {
+        feed_url: entry
+        for feed_url, (_, entry) in zip(feeds, results)
+        if entry.get("etag") or entry.get("modified")
+    })
+
+    for feed_url, (items, _) in zip(feeds, results):
+        # Infer source name
+        source = "BBC" if "bbc.co.uk" in feed_url else "News"
+
+        for it in items:
+            key = it["url"]
+            if key in seen:
+                continue
+            seen.add(key)
+            collected.append(
+                {
+                    "source": source,
+                    "title": it["title"],
+                    "summary": it.get("summary", "") or "",
+                    "url": it["url"],
+                    "reader_url": reader_link(it["url"]),
+                }
+            )
+            if len(collected) >= limit:
+                return collected
 
     return collected[:limit]
 
@@ -160,7 +300,44 @@ def fetch_world_stories(limit=3):
 # Weather + sunrise/sunset (Open-Meteo)
 # -----------------------------
 
+WEATHER_CACHE_TTL = 30 * 60
+
+
+def _weather_from_cache(cached):
+    # None (treated as a cache miss) if the file isn't the shape we write
+    if not isinstance(cached, list) or len(cached) != 2 or not all(isinstance(d, dict) for d in cached):
+        return None
+    weather, sun = cached
+    return weather, sun
+
+
 def get_cardiff_weather_and_sun():
+    """
+    Same as fetch_cardiff_weather_and_sun, served from the on-disk cache
+    when the last successful fetch is under WEATHER_CACHE_TTL old. If the
+    fetch fails, a reading cached earlier the same local day is used
+    (today's hi/lo and sun times still hold).
+    """
+    cached = _weather_from_cache(cache_get("weather", WEATHER_CACHE_TTL))
+    if cached:
+        return cached
+
+    try:
+        weather, sun = fetch_cardiff_weather_and_sun()
+    except Exception as ex:
+        now = now_local()
+        since_midnight = now.timestamp() - now.replace(hour=0, minute=0, second=0, microsecond=0).timestamp()
+        stale = _weather_from_cache(cache_get("weather", since_midnight))
+        if not stale:
+            raise
+        print("Weather fetch failed, using stale cache:", repr(ex))
+        return stale
+
+    cache_put("weather", [weather, sun])
+    return weather, sun
+
+
+def fetch_cardiff_weather_and_sun():
     """
     Uses Open-Meteo (no API key). Returns:
     weather: dict {temp, feels, hi, lo}
@@ -173,7 +350,7 @@ def get_cardiff_weather_and_sun():
         f"&daily=temperature_2m_max,temperature_2m_min,sunrise,sunset"
         f"&timezone={quote_plus(TIMEZONE)}"
     )
-    r = requests.get(url, timeout=15)
+    r = SESSION.get(url, timeout=15)
     r.raise_for_status()
     data = r.json()
 
@@ -212,7 +389,78 @@ def get_cardiff_weather_and_sun():
 # Who's in space
 # -----------------------------
 
+SPACE_CACHE_TTL = 6 * 60 * 60
+# Oldest roster shown when both sources fail; past this, crews may have landed
+SPACE_STALE_TTL = 3 * 24 * 60 * 60
+
+
+def parse_iso_utc(s: str):
+    """
+    Parses an ISO-8601 timestamp into an aware UTC datetime, or None.
+    Naive values are taken as UTC.
+    """
+    if not s or not isinstance(s, str):
+        return None
+    s = s.strip()
+    # Normalise "Z" -> "+00:00"
+    if s.endswith("Z"):
+        s = s[:-1] + "+00:00"
+    try:
+        d = dt.datetime.fromisoformat(s)
+        if d.tzinfo is None:
+            d = d.replace(tzinfo=dt.timezone.utc)
+        return d.astimezone(dt.timezone.utc)
+    except Exception:
+        return None
+
+
+def _people_from_cache(cached):
+    # None (treated as a cache miss) if the file isn't the shape we write
+    if not isinstance(cached, list) or not all(isinstance(p, dict) for p in cached):
+        return None
+    return [
+        {
+            "name": p.get("name", ""),
+            "mission": p.get("mission", ""),
+            "launched_utc": parse_iso_utc(p.get("launched_utc")),
+        }
+        for p in cached
+    ]
+
+
 def get_whos_in_space():
+    """
+    Same as fetch_whos_in_space, served from the on-disk cache when the
+    last non-empty roster is under SPACE_CACHE_TTL old (crews change
+    on the scale of weeks). If both sources come back empty, a roster
+    cached within SPACE_STALE_TTL is used instead.
+    """
+    cached = _people_from_cache(cache_get("space", SPACE_CACHE_TTL))
+    if cached:
+        return cached
+
+    people = fetch_whos_in_space()
+    if not people:
+        stale = _people_from_cache(cache_get("space", SPACE_STALE_TTL))
+        if stale:
+            print("Crew fetch returned nothing, using stale cache")
+            return stale
+    else:
+        cache_put(
+            "space",
+            [
+                {
+                    "name": p["name"],
+                    "mission": p["mission"],
+                    "launched_utc": p["launched_utc"].isoformat() if p.get("launched_utc") else None,
+                }
+                for p in people
+            ],
+        )
+    return people
+
+
+def fetch_whos_in_space():
     """
     Mirror whoisinspace.com.
     Returns list[dict] with:
@@ -220,35 +468,15 @@ def get_whos_in_space():
       - mission: str
       - launched_utc: datetime | None
     """
-    import json
-    import re
-    import datetime as dt
-
     headers = {"User-Agent": "2k-times-bot/1.0"}
 
-    def _parse_iso_dt(s: str):
-        if not s:
-            return None
-        s = s.strip()
-        # Normalise "Z" -> "+00:00"
-        if s.endswith("Z"):
-            s = s[:-1] + "+00:00"
-        try:
-            d = dt.datetime.fromisoformat(s)
-            if d.tzinfo is None:
-                d = d.replace(tzinfo=dt.timezone.utc)
-            return d.astimezone(dt.timezone.utc)
-        except Exception:
-            return None
-
     # 1) Source of truth: whoisinspace.com page (Next.js)
     try:
-        r = requests.get("https://whoisinspace.com/", timeout=20, headers=headers)
+        r = SESSION.get("https://whoisinspace.com/", timeout=20, headers=headers)
         r.raise_for_status()
-        html = r.text
+        page = r.text
 
-        # Next.js embeds JSON in a script tag with id="__NEXT_DATA__"
-        m = re.search(r'<script[^>]+id="__NEXT_DATA__"[^>]*>(.*?)</script>', html, re.S)
+        m = NEXT_DATA_RE.search(page)
         if not m:
             raise RuntimeError("whoisinspace.com: __NEXT_DATA__ not found")
 
@@ -291,7 +519,7 @@ def get_whos_in_space():
 
                     launched_dt = None
                     if isinstance(launched, str):
-                        launched_dt = _parse_iso_dt(launched)
+                        launched_dt = parse_iso_utc(launched)
                     elif isinstance(launched, (int, float)):
                         # sometimes epoch seconds/ms
                         ts = float(launched)
@@ -339,7 +567,7 @@ def get_whos_in_space():
 
     # 2) Fallback: Open Notify (no mission/duration available)
     try:
-        r = requests.get("http://api.open-notify.org/astros.json", timeout=15, headers=headers)
+        r = SESSION.get("http://api.open-notify.org/astros.json", timeout=15, headers=headers)
         r.raise_for_status()
         data = r.json() or {}
         out = []
@@ -358,23 +586,30 @@ def get_whos_in_space():
 # HTML rendering (matches screenshot layout)
 # -----------------------------
 
-def render_story(story, idx: int) -> str:
-    title = e(story.get("title"))
-    source = e(story.get("source"))
-    summary = e(story.get("summary"))
-
-    # Prefer reader_url if present; else url
-    raw_link = story.get("reader_url") or story.get("url") or ""
-    link = e(raw_link)
+# Static <style> prelude: built once at import rather than per render
+EMAIL_STYLE_BLOCK = """<style>
+    /* Mobile stacking */
+    @media screen and (max-width: 600px) {
+      .col-stack {
+        display: block !important;
+        width: 100% !important;
+        max-width: 100% !important;
+      }
+    
+      .rule-vert {
+        display: none !important;
+      }
+    
+      .pad-reset {
+        padding-left: 0 !important;
+        padding-right: 0 !important;
+      }
+    }
+    </style>"""
 
-    link_html = (
-        f'<a href="{link}" style="color:#5aa2ff; text-decoration:none; font-weight:600;">Read in Reader →</a>'
-        if raw_link else ""
-    )
 
-    # “Top story” styling for first card
-    if idx == 1:
-        return f"""
+# Story card skeletons, parsed once; render_story fills them with one % call
+TOP_STORY_HTML = """
         <div style="padding:18px 0; border-bottom:1px solid rgba(255,255,255,0.08);">
           <div style="display:flex; gap:16px;">
             <div style="width:4px; background:#eaeaea; border-radius:2px; opacity:0.9;"></div>
@@ -383,92 +618,101 @@ def render_story(story, idx: int) -> str:
                 TOP STORY
               </div>
               <div style="font-size:22px; line-height:1.15; font-weight:800; margin:0 0 10px 0;">
-                {idx}. {title}
+                %(idx)s. %(title)s
               </div>
               <div style="font-size:14px; line-height:1.55; opacity:0.9; margin-bottom:12px;">
-                {summary}
+                %(summary)s
               </div>
               <div style="font-size:16px;">
-                {link_html}
+                %(link_html)s
               </div>
             </div>
           </div>
         </div>
         """
 
-    # Normal stories
-    return f"""
+STORY_HTML = """
     <div style="padding:18px 0; border-bottom:1px solid rgba(255,255,255,0.08);">
       <div style="font-size:20px; line-height:1.15; font-weight:800; margin:0 0 10px 0;">
-        {idx}. {title}
+        %(idx)s. %(title)s
       </div>
       <div style="font-size:14px; line-height:1.55; opacity:0.9; margin-bottom:12px;">
-        {summary}
+        %(summary)s
       </div>
       <div style="font-size:16px;">
-        {link_html}
+        %(link_html)s
       </div>
     </div>
     """
 
 
-def render_box(title: str, body_html: str) -> str:
-    return f"""
+def render_story(story, idx: int) -> str:
+    # Prefer reader_url if present; else url
+    raw_link = story.get("reader_url") or story.get("url") or ""
+
+    link_html = (
+        f'<a href="{e(raw_link)}" style="color:#5aa2ff; text-decoration:none; font-weight:600;">Read in Reader →</a>'
+        if raw_link else ""
+    )
+
+    # “Top story” styling for first card
+    tmpl = TOP_STORY_HTML if idx == 1 else STORY_HTML
+    return tmpl % {
+        "idx": idx,
+        "title": e(story.get("title")),
+        "summary": e(story.get("summary")),
+        "link_html": link_html,
+    }
+
+
+BOX_HTML = """
     <div style="padding:16px 0; border-bottom:1px solid rgba(255,255,255,0.08);">
       <div style="font-size:16px; font-weight:800; margin-bottom:10px; display:flex; align-items:center; gap:10px;">
-        {title}
+        %(title)s
       </div>
       <div style="font-size:14px; line-height:1.5; opacity:0.95;">
-        {body_html}
+        %(body_html)s
       </div>
     </div>
     """
 
 
-def build_email_html(world, weather, sun, people, edition_tag="v-newspaper-17") -> str:
-    local = now_local()
-    edition_line = f"{local.strftime('%d.%m.%Y')} · Daily Edition · {edition_tag}"
+def render_box(title: str, body_html: str) -> str:
+    return BOX_HTML % {"title": title, "body_html": body_html}
 
-    # Left column: world headlines
-    stories_html = "".join(render_story(s, i + 1) for i, s in enumerate(world[:3]))
 
-    # Right column: inside today + weather + sunrise/sunset + space
-    inside_html = """
-      <div style="opacity:0.9; margin-bottom:10px;">Curated from the last 24 hours.<br/>Reader links included.</div>
+def minify_html(html_text: str) -> str:
     """
-
-    # Weather
-    w = weather or {}
-    weather_line = f"{e(w.get('temp'))} (feels {e(w.get('feels'))}) · H {e(w.get('hi'))} / L {e(w.get('lo'))}"
-    weather_html = f"""
-      <div style="font-weight:700; margin-bottom:6px;">{e(w.get('location', 'Cardiff'))}</div>
-      <div>{weather_line}</div>
+    Drops the template indentation and blank lines. HTML collapses
+    whitespace anyway (no <pre> here), so rendering is unchanged but the
+    payload posted to Mailgun shrinks noticeably.
     """
+    return "\n".join(line.strip() for line in html_text.splitlines() if line.strip())
 
-    # Sunrise/sunset
-    s = sun or {}
-    sun_html = f"""
-      <div>Sunrise: <b>{e(s.get('sunrise'))}</b> &nbsp;·&nbsp; Sunset: <b>{e(s.get('sunset'))}</b></div>
+
+def fmt_duration(delta: dt.timedelta) -> str:
+    total = int(delta.total_seconds())
+    if total < 0:
+        total = 0
+    days = total // 86400
+    hours = (total % 86400) // 3600
+    mins = (total % 3600) // 60
+    if days >= 1:
+        return f"{days}d {hours:02d}h"
+    if hours >= 1:
+        return f"{hours}h {mins:02d}m"
+    return f"{mins}m"
+
+
+def render_people(people) -> str:
     """
+    people is expected to be list[dict] with: name, mission, launched_utc
+    """
+    if not people:
+        return "Unavailable right now."
 
-    # Who's in space (mirror whoisinspace.com: mission + time on mission)
-if people:
-    # people is expected to be list[dict] with: name, mission, launched_utc
     now = dt.datetime.now(dt.timezone.utc)
 
-    def _fmt_duration(delta: dt.timedelta) -> str:
-        total = int(delta.total_seconds())
-        if total < 0:
-            total = 0
-        days = total // 86400
-        hours = (total % 86400) // 3600
-        mins = (total % 3600) // 60
-        if days >= 1:
-            return f"{days}d {hours:02d}h"
-        if hours >= 1:
-            return f"{hours}h {mins:02d}m"
-        return f"{mins}m"
-
     rows = []
     for p in people:
         name = e(p.get("name", ""))
@@ -479,49 +723,23 @@ if people:
         if isinstance(launched, dt.datetime):
             if launched.tzinfo is None:
                 launched = launched.replace(tzinfo=dt.timezone.utc)
-            dur = _fmt_duration(now - launched)
+            dur = fmt_duration(now - launched)
 
         rows.append(f"<div style='margin:0 0 6px 0;'>{name} — {mission} — {dur}</div>")
 
-    ppl_html = "".join(rows) if rows else "Unavailable right now."
-else:
-    ppl_html = "Unavailable right now."
+    return "".join(rows)
 
 
-    right_col = (
-        render_box("🔎 Inside today", inside_html)
-        + render_box("⛅ Weather · Cardiff", weather_html)
-        + render_box("🌅 Sunrise / Sunset", sun_html)
-        + render_box("🚀 Who's in space", ppl_html)
-    )
-
-    # Whole email
-    html_out = f"""<!doctype html>
+# Static email shell, split around the per-edition slots so each render
+# is a single join of constants and the few dynamic fragments.
+EMAIL_HEAD = """<!doctype html>
     <html>
     <head>
     <meta charset="utf-8"/>
     <meta name="viewport" content="width=device-width, initial-scale=1"/>
     <title>The 2k Times</title>
     
-    <style>
-    /* Mobile stacking */
-    @media screen and (max-width: 600px) {{
-      .col-stack {{
-        display: block !important;
-        width: 100% !important;
-        max-width: 100% !important;
-      }}
-    
-      .rule-vert {{
-        display: none !important;
-      }}
-    
-      .pad-reset {{
-        padding-left: 0 !important;
-        padding-right: 0 !important;
-      }}
-    }}
-    </style>
+    """ + EMAIL_STYLE_BLOCK + """
     
     </head>
     <body style="margin:0; padding:0; background:#0f1115; color:#f2f2f2; font-family: Arial, Helvetica, sans-serif;">
@@ -535,7 +753,9 @@ else:
               
         <div style="text-align:center; margin-bottom:18px;">
           <div style="font-size:64px; font-weight:900; letter-spacing:-0.02em;">The 2k Times</div>
-          <div style="margin-top:10px; font-size:18px; opacity:0.9;">{e(edition_line)}</div>
+          <div style="margin-top:10px; font-size:18px; opacity:0.9;">"""
+
+EMAIL_MASTHEAD_END = """</div>
         </div>
     
         <div style="height:1px; background:rgba(255,255,255,0.12); margin:18px 0 22px;"></div>
@@ -546,7 +766,9 @@ else:
         <td valign="top" width="64%"
         class="col-stack pad-reset"
         style="width:64%; padding-right:16px;">
-      {stories_html}
+      """
+
+EMAIL_COLUMN_DIVIDER = """
     </td>
     
         <!-- Vertical divider -->
@@ -560,8 +782,12 @@ else:
         <td valign="top" width="36%"
         class="col-stack pad-reset"
         style="width:36%; padding-left:16px;">
-      {right_col}
+      """
+
+EMAIL_FOOT = """
     </td>
+      </tr>
+    </table>
     
         <div style="height:1px; background:rgba(255,255,255,0.12); margin:22px 0 14px;"></div>
         <div style="font-size:12px; opacity:0.65;">
@@ -576,7 +802,57 @@ else:
     </body>
     </html>
     """
-    return html_out
+
+
+def build_email_html(world, weather, sun, people, edition_tag="v-newspaper-17") -> str:
+    local = now_local()
+    edition_line = f"{local.strftime('%d.%m.%Y')} · Daily Edition · {edition_tag}"
+
+    # Left column: world headlines
+    stories_html = "".join([render_story(s, i + 1) for i, s in enumerate(world[:3])])
+
+    # Right column: inside today + weather + sunrise/sunset + space
+    inside_html = """
+      <div style="opacity:0.9; margin-bottom:10px;">Curated from the last 24 hours.<br/>Reader links included.</div>
+    """
+
+    # Right column boxes; sections with no data are left out entirely
+    boxes = [render_box("🔎 Inside today", inside_html)]
+
+    # Weather
+    w = weather or {}
+    if w.get("temp"):
+        weather_line = f"{e(w.get('temp'))} (feels {e(w.get('feels'))}) · H {e(w.get('hi'))} / L {e(w.get('lo'))}"
+        weather_html = f"""
+      <div style="font-weight:700; margin-bottom:6px;">{e(w.get('location', 'Cardiff'))}</div>
+      <div>{weather_line}</div>
+    """
+        boxes.append(render_box("⛅ Weather · Cardiff", weather_html))
+
+    # Sunrise/sunset
+    s = sun or {}
+    if s.get("sunrise") or s.get("sunset"):
+        sun_html = f"""
+      <div>Sunrise: <b>{e(s.get('sunrise'))}</b> &nbsp;·&nbsp; Sunset: <b>{e(s.get('sunset'))}</b></div>
+    """
+        boxes.append(render_box("🌅 Sunrise / Sunset", sun_html))
+
+    # Who's in space (mirror whoisinspace.com: mission + time on mission)
+    boxes.append(render_box("🚀 Who's in space", render_people(people)))
+
+    right_col = "".join(boxes)
+
+    # Whole email
+    html_out = "".join([
+        EMAIL_HEAD,
+        e(edition_line),
+        EMAIL_MASTHEAD_END,
+        stories_html,
+        EMAIL_COLUMN_DIVIDER,
+        right_col,
+        EMAIL_FOOT,
+    ])
+    return minify_html(html_out)
 
 
 # -----------------------------
@@ -589,24 +865,33 @@ def send_mailgun(subject: str, html_body: str) -> bool:
       MAILGUN_API_KEY
       MAILGUN_DOMAIN
       MAILGUN_FROM
-      MAILGUN_TO
+      MAILGUN_TO (comma-separated for several recipients)
+
+    All recipients go out in one API call. Mailgun batch sending
+    (recipient-variables) gives each their own copy, so addresses
+    are never exposed to each other.
     """
     api_key = env_required("MAILGUN_API_KEY")
     domain = env_required("MAILGUN_DOMAIN")
     from_addr = env_required("MAILGUN_FROM")
-    to_addr = env_required("MAILGUN_TO")
+    to_addrs = [a.strip() for a in env_required("MAILGUN_TO").split(",") if a.strip()]
 
     url = f"https://api.mailgun.net/v3/{domain}/messages"
     auth = ("api", api_key)
 
     data = {
         "from": from_addr,
-        "to": [to_addr],
+        "to": to_addrs,
         "subject": subject,
-        "html": html_body,
     }
+    if len(to_addrs) > 1:
+        data["recipient-variables"] = json.dumps({a: {} for a in to_addrs})
+
+    # Sent as a multipart part so the body goes out as-is rather than
+    # percent-encoded (about 1.4x larger for a typical edition)
+    files = {"html": (None, html_body.encode("utf-8"), "text/html; charset=utf-8")}
 
-    r = requests.post(url, auth=auth, data=data, timeout=20)
+    r = SESSION.post(url, auth=auth, data=data, files=files, timeout=20)
     if r.status_code >= 400:
         print(f"Mailgun send failed: {r.status_code} {r.text}")
         return False
@@ -620,23 +905,44 @@ def send_mailgun(subject: str, html_body: str) -> bool:
 def main():
     print(">>> run.py starting")
 
-    world = fetch_world_stories(limit=3)
-    if not world:
-        # Fail-safe so we never end up sending an empty email
-        world = [{
-            "source": "System",
-            "title": "World headlines temporarily unavailable",
-            "summary": "Your feeds didn’t return stories this run. Check WORLD_FEEDS or RSS availability.",
-            "url": "",
-            "reader_url": "",
-        }]
+    # With SKIP_EMPTY_EDITIONS the feeds go first, so a skipped edition
+    # never waits on the sidebar requests
+    skip_empty = bool_env("SKIP_EMPTY_EDITIONS", False)
+    if skip_empty:
+        world = fetch_world_stories(limit=3)
+        if not world:
+            # Nothing worth sending: skip sidebar, rendering and Mailgun
+            print("No world headlines — SKIP_EMPTY_EDITIONS=true, skipping edition")
+            print(">>> run.py finished")
+            return
+
+    # Sidebar data doesn't depend on the headlines, so otherwise fetch it
+    # while the feeds load: wall time becomes the slowest source, not the sum
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        weather_future = ex.submit(get_cardiff_weather_and_sun)
+        people_future = ex.submit(get_whos_in_space)
+
+        if not skip_empty:
+            world = fetch_world_stories(limit=3)
+        if not world:
+            # Fail-safe so we never end up sending an empty email
+            world = [{
+                "source": "System",
+                "title": "World headlines temporarily unavailable",
+                "summary": "Your feeds didn’t return stories this run. Check WORLD_FEEDS or RSS availability.",
+                "url": "",
+                "reader_url": "",
+            }]
 
-    try:
-        weather, sun = get_cardiff_weather_and_sun()
-    except Exception:
-        weather, sun = ({"location": "Cardiff", "temp": "", "feels": "", "hi": "", "lo": ""}, {"sunrise": "", "sunset": ""})
+        try:
+            weather, sun = weather_future.result()
+        except Exception:
+            weather, sun = ({"location": "Cardiff", "temp": "", "feels": "", "hi": "", "lo": ""}, {"sunrise": "", "sunset": ""})
 
-    people = get_whos_in_space()
+        try:
+            people = people_future.result()
+        except Exception:
+            people = []
 
     email_html = build_email_html(
         world=world,